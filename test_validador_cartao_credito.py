@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Testes diferenciais do algoritmo Luhn e da identificação de bandeiras.
+
+Comparam cada implementação do algoritmo Luhn com uma versão de referência,
+``eh_valido`` e ``validar_cartoes`` com ``validar_cartao``, o padrão Elo fatorado com a alternância original e o despacho por comprimento e
+prefixo (IIN) com a verificação linear de todos os padrões, na ordem de
+prioridade. Execute com ``python -m unittest`` ou ``pytest``.
+"""
+
+import random
+import re
+import unittest
+
+import validador_cartao_credito
+from validador_cartao_credito import ValidadorCartaoCredito
+
+# Padrão Elo original, antes da fatoração dos prefixos comuns
+ELO_ORIGINAL = re.compile(
+    r'(4011(78|79)|43(1274|8935)|45(1416|7393|763[12])|50(4175|6699|67[0-6][0-9]|677[0-8]|9[0-8][0-9]{2}|'
+    r'99[0-8][0-9]|999[0-9])|627780|63(6297|6368|6369)|65(0(0(3[1-3]|[5-9])|4[0-9]|5[0-1])|4(0[5-9]|'
+    r'[1-3][0-9]|8[5-9]|9[0-9])|5([0-2][0-9]|3[0-8]|4[1-9]|[5-8][0-9]|9[0-8])|7(0[0-9]|1[0-8]|2[0-7])|'
+    r'9(0[1-9]|[1-6][0-9]|7[0-8]))|16(5[2-9]|[6-7][0-9])|50(0[0-9]|1[0-9]|2[1-9]|[3-4][0-9]|5[0-8]))'
+)
+
+
+def digitos_ate(comprimento_maximo):
+    """Gera todas as strings de 1 até ``comprimento_maximo`` dígitos."""
+    for comprimento in range(1, comprimento_maximo + 1):
+        for i in range(10 ** comprimento):
+            yield str(i).zfill(comprimento)
+
+
+def luhn_referencia(numero):
+    """Referência: algoritmo Luhn dobrando um dígito sim, outro não, a partir do penúltimo."""
+    soma = 0
+    for i, digito in enumerate(reversed(numero)):
+        valor = int(digito) * (2 if i % 2 else 1)
+        soma += valor - 9 if valor > 9 else valor
+    return soma % 10 == 0
+
+
+def digitos_aleatorios(comprimento, quantidade, semente=0):
+    """Gera ``quantidade`` strings aleatórias de ``comprimento`` dígitos."""
+    aleatorio = random.Random(semente * 100 + comprimento)
+    for _ in range(quantidade):
+        yield ''.join(aleatorio.choice('0123456789') for _ in range(comprimento))
+
+
+def completar_luhn(numero):
+    """Troca o último dígito de ``numero`` pelo dígito verificador Luhn."""
+    for digito in '0123456789':
+        if luhn_referencia(numero[:-1] + digito):
+            return numero[:-1] + digito
+
+
+def identificar_linear(numero):
+    """Referência: testa todos os padrões, em ordem de prioridade."""
+    for bandeira, padrao in ValidadorCartaoCredito.padroes_bandeiras.items():
+        if re.fullmatch(padrao, numero):
+            return ValidadorCartaoCredito.nomes_bandeiras[bandeira]
+    return None
+
+
+def numeros_aleatorios(semente=0):
+    """Números de 7 a 21 dígitos para todos os prefixos de 4 dígitos e IINs das tabelas."""
+    aleatorio = random.Random(semente)
+    prefixos = [str(i).zfill(4) for i in range(10000)]
+    prefixos += sorted({prefixo for lista in ValidadorCartaoCredito.prefixos_bandeiras.values()
+                        for prefixo in lista})
+    for prefixo in prefixos:
+        for comprimento in range(7, 22):
+            resto = comprimento - len(prefixo)
+            yield prefixo + ''.join(aleatorio.choice('0123456789') for _ in range(resto))
+
+
+class TestLuhn(unittest.TestCase):
+
+    COMPRIMENTOS = range(1, 26)
+
+    def verificar(self, luhn, comprimentos=COMPRIMENTOS, quantidade=2000):
+        for comprimento in comprimentos:
+            for numero in digitos_aleatorios(comprimento, quantidade):
+                self.assertEqual(luhn(numero), luhn_referencia(numero), numero)
+
+    def test_extensao_c(self):
+        _luhn = validador_cartao_credito._luhn
+        if _luhn is None:
+            self.skipTest('extensão _luhn não compilada')
+
+        self.verificar(lambda numero: _luhn.luhn16(numero.encode('ascii')), [16])
+        self.verificar(lambda numero: _luhn.luhn15(numero.encode('ascii')), [15])
+
+    def test_aritmetico(self):
+        self.verificar(validador_cartao_credito._luhn_aritmetico)
+        self.verificar(validador_cartao_credito._luhn_aritmetico, [4301, 5000], quantidade=20)
+
+    def test_desenrolado(self):
+        self.verificar(validador_cartao_credito._luhn16, [16])
+
+    def test_numba(self):
+        luhn_nativo = validador_cartao_credito._compilar_luhn_njit()
+        if luhn_nativo is None:
+            self.skipTest('numba ou numpy não instalado')
+
+        self.verificar(luhn_nativo)
+
+    def test_lote(self):
+        if validador_cartao_credito._importar_numpy() is None:
+            self.skipTest('numpy não instalado')
+
+        for comprimento in self.COMPRIMENTOS:
+            numeros = list(digitos_aleatorios(comprimento, 2000))
+            resultados = validador_cartao_credito._luhn_lote(numeros, comprimento)
+            self.assertEqual(resultados, [luhn_referencia(numero) for numero in numeros], comprimento)
+
+    def test_validar_luhn(self):
+        self.verificar(ValidadorCartaoCredito().validar_luhn)
+        self.assertIsInstance(ValidadorCartaoCredito().validar_luhn('1' * 5000), bool)
+
+    def test_validar_luhn_numba(self):
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            self.skipTest('numba não instalado')
+
+        self.verificar(ValidadorCartaoCredito(usar_numba=True).validar_luhn)
+
+
+class TestValidacaoEquivalente(unittest.TestCase):
+
+    CHAVES_RESULTADO = {'numero_original', 'numero_limpo', 'valido_luhn', 'bandeira',
+                        'valido_completo', 'comprimento', 'mensagem'}
+
+    def entradas(self):
+        """Números válidos e inválidos, formatados, curtos, longos e com Unicode."""
+        aleatorio = random.Random(3)
+        for numero in numeros_aleatorios(semente=3):
+            if aleatorio.random() < 0.05:
+                valido = completar_luhn(numero)
+                yield numero
+                yield valido
+                yield ' '.join(valido[i:i + 4] for i in range(0, len(valido), 4))
+                yield '-'.join(valido[i:i + 4] for i in range(0, len(valido), 4))
+                yield '\u00a0'.join(valido[i:i + 4] for i in range(0, len(valido), 4))
+                yield valido + '\u0663'
+                yield '\u0664' + valido[1:]
+                yield valido[:12]
+                yield valido[:12] + 'a'
+                yield ' ' + valido[:12]
+        yield ''
+        yield '4111 1111 1111 1111'
+        yield '4111-1111-1111-1111'
+        yield '4111111111111111' * 2
+        yield '1' * 5000
+        yield '٤١١١١١١١١١١١١١١١'
+        yield '4111\u20031111\u20031111\u20031111'
+
+    def test_eh_valido_validar_cartoes_e_validar_cartao(self):
+        validador = ValidadorCartaoCredito()
+        entradas = list(self.entradas())
+        lote = validador.validar_cartoes(entradas)
+        for numero, valido_lote in zip(entradas, lote):
+            completo = validador.validar_cartao(numero).valido_completo
+            self.assertEqual(validador.eh_valido(numero), completo, numero)
+            self.assertEqual(validador.validar_cartoes([numero]), [completo], numero)
+            self.assertEqual(valido_lote, completo, numero)
+        self.assertIn(True, lote)
+
+    def test_chaves_to_dict(self):
+        validador = ValidadorCartaoCredito()
+        for numero in ('4111 1111 1111 1111', '4111111111111112', '123', ''):
+            self.assertEqual(set(validador.validar_cartao(numero).to_dict()), self.CHAVES_RESULTADO)
+
+
+class TestPadraoElo(unittest.TestCase):
+
+    def test_mesma_linguagem_ate_6_digitos(self):
+        elo = re.compile(ValidadorCartaoCredito.padroes_bandeiras['elo'])
+        for numero in digitos_ate(6):
+            self.assertEqual(elo.fullmatch(numero) is not None, ELO_ORIGINAL.fullmatch(numero) is not None, numero)
+
+    def test_mesma_linguagem_aleatoria(self):
+        elo = re.compile(ValidadorCartaoCredito.padroes_bandeiras['elo'])
+        aleatorio = random.Random(1)
+        for _ in range(100000):
+            comprimento = aleatorio.randint(1, 10)
+            numero = ''.join(aleatorio.choice('0123456789') for _ in range(comprimento))
+            self.assertEqual(elo.fullmatch(numero) is not None, ELO_ORIGINAL.fullmatch(numero) is not None, numero)
+
+
+class TestDespachoBandeiras(unittest.TestCase):
+
+    def setUp(self):
+        self.validador = ValidadorCartaoCredito()
+
+    def test_despacho_ate_6_digitos(self):
+        for numero in digitos_ate(6):
+            self.assertEqual(self.validador.identificar_bandeira(numero), identificar_linear(numero), numero)
+
+    def test_despacho_numeros_aleatorios(self):
+        for numero in numeros_aleatorios():
+            self.assertEqual(self.validador.identificar_bandeira(numero), identificar_linear(numero), numero)
+
+    def test_hyperscan(self):
+        try:
+            validador = ValidadorCartaoCredito(usar_hyperscan=True)
+        except ImportError:
+            self.skipTest('hyperscan não instalado')
+
+        for numero in numeros_aleatorios(semente=2):
+            self.assertEqual(validador.identificar_bandeira(numero), identificar_linear(numero), numero)
+
+
+if __name__ == '__main__':
+    unittest.main()
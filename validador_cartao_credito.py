@@ -23,8 +23,310 @@ Autor: Gerado por IA
 Data: 2025
 """
 
+import functools
 import re
-from typing import Optional, Dict, Any
+import threading
+from types import MappingProxyType
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Iterable, List, Mapping, Pattern, Tuple
+
+try:
+    # Extensão C opcional (_luhn.c) com o algoritmo Luhn para 15 e 16 dígitos
+    import _luhn
+except ImportError:
+    _luhn = None
+
+# Tabela para str.translate que remove todo caractere Latin-1 que não seja um
+# dígito ASCII; caracteres acima de U+00FF ficam para a expressão regular
+_REMOVER_NAO_DIGITOS = str.maketrans('', '', ''.join(chr(i) for i in range(256) if chr(i) not in '0123456789'))
+
+
+@dataclass
+class ResultadoValidacao:
+    """
+    Resultado da validação de um número de cartão de crédito.
+
+    Attributes:
+        numero_original: Número como foi fornecido
+        numero_limpo: Número apenas com dígitos
+        valido_luhn: Se passou na validação Luhn
+        bandeira: Nome da bandeira identificada
+        valido_completo: Se é válido e tem bandeira identificada
+        comprimento: Número de dígitos
+        mensagem: Mensagem descritiva do resultado
+    """
+
+    # __slots__ declarado à mão (em vez de dataclass(slots=True), que exige
+    # Python 3.10); possível porque nenhum campo tem valor padrão
+    __slots__ = ('numero_original', 'numero_limpo', 'valido_luhn', 'bandeira',
+                 'valido_completo', 'comprimento', 'mensagem')
+
+    numero_original: str
+    numero_limpo: str
+    valido_luhn: bool
+    bandeira: Optional[str]
+    valido_completo: bool
+    comprimento: int
+    mensagem: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Converte o resultado no dicionário retornado por versões anteriores.
+
+        Returns:
+            dict: Campos do resultado indexados pelo nome
+        """
+        return {
+            'numero_original': self.numero_original,
+            'numero_limpo': self.numero_limpo,
+            'valido_luhn': self.valido_luhn,
+            'bandeira': self.bandeira,
+            'valido_completo': self.valido_completo,
+            'comprimento': self.comprimento,
+            'mensagem': self.mensagem
+        }
+
+
+def _compilar_bandeiras(padroes: Mapping[str, str],
+                        nomes: Mapping[str, str]) -> Dict[str, Tuple[Pattern[str], str]]:
+    """
+    Compila os padrões das bandeiras, associando cada um ao nome de exibição.
+
+    Args:
+        padroes: Padrões regex indexados pela chave da bandeira
+        nomes: Nomes de exibição indexados pela chave da bandeira
+
+    Returns:
+        dict: Pares (padrão compilado, nome da bandeira) indexados pela chave
+            da bandeira, na ordem de verificação
+    """
+    return {bandeira: (re.compile(padrao), nomes[bandeira]) for bandeira, padrao in padroes.items()}
+
+
+def _indexar_por_prefixo(bandeiras: Dict[str, Tuple[Pattern[str], str]],
+                         prefixos: Mapping[str, Tuple[str, ...]]) -> Dict[str, Tuple[Tuple[Pattern[str], str], ...]]:
+    """
+    Monta a tabela de despacho por prefixo (IIN) das bandeiras.
+
+    Cada prefixo conhecido aponta para todas as bandeiras que podem começar
+    com ele, incluindo as de prefixo mais curto (ex.: "401178" lista Visa e Elo),
+    mantendo a ordem de verificação original.
+
+    Args:
+        bandeiras: Saída de _compilar_bandeiras
+        prefixos: Prefixos possíveis de cada bandeira
+
+    Returns:
+        dict: Pares (padrão compilado, nome da bandeira) candidatos por prefixo
+    """
+    todos = {prefixo for bandeira in bandeiras for prefixo in prefixos[bandeira]}
+    return {
+        chave: tuple(par for bandeira, par in bandeiras.items()
+                     if any(chave.startswith(prefixo) for prefixo in prefixos[bandeira]))
+        for chave in todos
+    }
+
+
+def _indexar_por_comprimento(bandeiras: Dict[str, Tuple[Pattern[str], str]],
+                             prefixos: Mapping[str, Tuple[str, ...]],
+                             comprimentos: Mapping[str, Tuple[int, ...]]) -> Dict[int, Dict[str, Tuple[Tuple[Pattern[str], str], ...]]]:
+    """
+    Monta uma tabela de despacho por prefixo para cada comprimento de número.
+
+    Cada tabela considera apenas as bandeiras que aceitam números daquele
+    comprimento; comprimentos que nenhuma bandeira aceita ficam de fora.
+
+    Args:
+        bandeiras: Saída de _compilar_bandeiras
+        prefixos: Prefixos possíveis de cada bandeira
+        comprimentos: Comprimentos possíveis de cada bandeira
+
+    Returns:
+        dict: Tabela de _indexar_por_prefixo por comprimento de número
+    """
+    todos = {comprimento for lista in comprimentos.values() for comprimento in lista}
+    return {
+        comprimento: _indexar_por_prefixo(
+            {bandeira: par for bandeira, par in bandeiras.items() if comprimento in comprimentos[bandeira]},
+            prefixos
+        )
+        for comprimento in sorted(todos)
+    }
+
+
+def _compilar_hyperscan(bandeiras: Mapping[str, Tuple[Pattern[str], str]]) -> Any:
+    """
+    Compila todos os padrões das bandeiras em uma base do Hyperscan.
+
+    O identificador de cada expressão é a posição da bandeira em ``bandeiras``,
+    ou seja, a sua prioridade de verificação. O pacote ``hyperscan`` só é
+    importado aqui, quando o uso do Hyperscan é solicitado.
+
+    Args:
+        bandeiras: Saída de _compilar_bandeiras
+
+    Returns:
+        hyperscan.Database: Base compilada
+
+    Raises:
+        ImportError: Se o Hyperscan não estiver instalado
+    """
+    import hyperscan
+
+    base = hyperscan.Database()
+    base.compile(
+        expressions=[padrao.pattern.encode('ascii') for padrao, _ in bandeiras.values()],
+        ids=list(range(len(bandeiras))),
+        elements=len(bandeiras),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(bandeiras)
+    )
+    return base
+
+
+@functools.lru_cache(maxsize=None)
+def _importar_numpy() -> Any:
+    """
+    Importa o NumPy opcional no primeiro uso, fora do caminho de importação do
+    módulo.
+
+    Returns:
+        module: Módulo numpy, ou None se não estiver instalado
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@functools.lru_cache(maxsize=None)
+def _compilar_luhn_njit() -> Any:
+    """
+    Compila com o Numba opcional o laço do algoritmo Luhn (uma vez por processo).
+
+    Returns:
+        function: Função que recebe o número (apenas dígitos) e retorna o
+            resultado do algoritmo Luhn, ou None sem o Numba (e o NumPy)
+    """
+    numpy = _importar_numpy()
+    if numpy is None:
+        return None
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def _luhn_njit(digitos):
+        # Algoritmo Luhn sobre o array uint8 com os códigos ASCII dos dígitos
+        soma = 0
+        n = len(digitos)
+        for i in range(n):
+            v = digitos[n - 1 - i] - 48
+            # Dobrar as posições ímpares (a partir da direita) sem desvio
+            v <<= i & 1
+            soma += v - (v > 9) * 9
+        return soma % 10 == 0
+
+    def luhn_nativo(numero: str) -> bool:
+        return bool(_luhn_njit(numpy.frombuffer(numero.encode('ascii'), dtype=numpy.uint8)))
+
+    return luhn_nativo
+
+
+def _luhn_aritmetico(numero: str) -> bool:
+    """
+    Algoritmo Luhn sobre inteiros Python, sem listas intermediárias.
+
+    O número é convertido em blocos de 20 dígitos (comprimento par, para
+    manter a alternância entre dígitos dobrados e não dobrados), o que cobre
+    qualquer cartão em um único bloco e evita o limite de dígitos de int() do
+    Python 3.11+ em entradas muito longas.
+
+    Args:
+        numero: Número contendo apenas dígitos
+
+    Returns:
+        bool: True se o número for válido pelo algoritmo Luhn
+    """
+    soma_total = 0
+    fim = len(numero)
+    while fim > 0:
+        n = int(numero[max(fim - 20, 0):fim])
+        fim -= 20
+
+        # Percorrer os dígitos do bloco da direita para a esquerda, dois por
+        # vez: o primeiro entra direto e o segundo dobrado, subtraindo 9 sem
+        # desvio condicional quando o dobro passa de 9
+        while n:
+            soma_total += n % 10
+            n //= 10
+            v = (n % 10) << 1
+            n //= 10
+            soma_total += v - (v > 9) * 9
+
+    # Verificar se é divisível por 10
+    return soma_total % 10 == 0
+
+
+def _gerar_luhn_desenrolado(comprimento: int):
+    """
+    Gera uma função Luhn especializada para um comprimento fixo de número.
+
+    O laço é desenrolado em uma única expressão com um termo por dígito, o que
+    elimina a contagem de índices e o despacho do laço no interpretador.
+
+    Args:
+        comprimento: Quantidade de dígitos do número
+
+    Returns:
+        function: Função que recebe o número (apenas dígitos, com exatamente
+            ``comprimento`` dígitos) e retorna o resultado do algoritmo Luhn
+    """
+    termos = []
+    for i in range(comprimento):
+        posicao = comprimento - 1 - i
+        if i & 1:
+            # Dígito dobrado, subtraindo 9 quando o dígito é 5 ou mais ('5' = 53)
+            termos.append(f'(ord(s[{posicao}]) - 48) * 2 - 9 * (ord(s[{posicao}]) >= 53)')
+        else:
+            termos.append(f'(ord(s[{posicao}]) - 48)')
+
+    codigo = f'def _luhn{comprimento}(s):\n    return ({" + ".join(termos)}) % 10 == 0\n'
+    namespace: Dict[str, Any] = {}
+    exec(codigo, namespace)
+    return namespace[f'_luhn{comprimento}']
+
+
+# Algoritmo Luhn desenrolado para o comprimento mais comum (16 dígitos)
+_luhn16 = _gerar_luhn_desenrolado(16)
+
+
+def _luhn_lote(numeros: List[str], comprimento: int) -> List[bool]:
+    """
+    Aplica o algoritmo Luhn de uma vez a vários números do mesmo comprimento.
+
+    Os dígitos são empacotados em uma matriz (N, comprimento) de uint8 e as
+    colunas a dobrar são selecionadas por máscara, sem laço em Python.
+
+    Args:
+        numeros: Números contendo apenas dígitos, todos com ``comprimento`` dígitos
+        comprimento: Quantidade de dígitos de cada número
+
+    Returns:
+        list: Resultado do algoritmo Luhn para cada número, na mesma ordem
+    """
+    np = _importar_numpy()
+    digitos = np.frombuffer(''.join(numeros).encode('ascii'), dtype=np.uint8)
+    digitos = digitos.reshape(len(numeros), comprimento) - ord('0')
+
+    # Dobrar um dígito sim, outro não, a partir do penúltimo
+    dobrar = np.zeros(comprimento, dtype=bool)
+    dobrar[-2::-2] = True
+    dobrados = digitos * 2 - 9 * (digitos >= 5)
+
+    valores = np.where(dobrar, dobrados, digitos)
+    return (valores.sum(axis=1) % 10 == 0).tolist()
 
 
 class ValidadorCartaoCredito:
@@ -33,34 +335,122 @@ class ValidadorCartaoCredito:
     Implementa o algoritmo Luhn e padrões de bandeiras nacionais e internacionais.
     """
 
-    def __init__(self):
-        # Padrões regex para identificação de bandeiras
-        self.padroes_bandeiras = {
-            'visa': r'^4[0-9]{12}(?:[0-9]{3})?$',
-            'mastercard': r'^5[1-5][0-9]{14}$|^2[2-7][0-9]{14}$',
-            'amex': r'^3[47][0-9]{13}$',
-            'elo': r'^(4011(78|79)|43(1274|8935)|45(1416|7393|763[12])|50(4175|6699|67[0-6][0-9]|677[0-8]|9[0-8][0-9]{2}|99[0-8][0-9]|999[0-9])|627780|63(6297|6368|6369)|65(0(0(3[1-3]|[5-9])|4[0-9]|5[0-1])|4(0[5-9]|[1-3][0-9]|8[5-9]|9[0-9])|5([0-2][0-9]|3[0-8]|4[1-9]|[5-8][0-9]|9[0-8])|7(0[0-9]|1[0-8]|2[0-7])|9(0[1-9]|[1-6][0-9]|7[0-8]))|16(5[2-9]|[6-7][0-9])|50(0[0-9]|1[0-9]|2[1-9]|[3-4][0-9]|5[0-8]))$',
-            'hipercard': r'^(606282\d{10}(\d{3})?|3841\d{15})$',
-            'diners': r'^3(?:0[0-5]|[68][0-9])[0-9]{11}$',
-            'discover': r'^6(?:011|5[0-9]{2})[0-9]{12}$',
-            'jcb': r'^(?:2131|1800|35\d{3})\d{11}$',
-            'aura': r'^5078\d{2}\d{2}\d{11}$',
-            'maestro': r'^(?:5[0678]\d\d|6304|6390|67\d\d)\d{8,15}$'
-        }
-
-        # Nomes das bandeiras em português
-        self.nomes_bandeiras = {
-            'visa': 'Visa',
-            'mastercard': 'Mastercard',
-            'amex': 'American Express',
-            'elo': 'Elo',
-            'hipercard': 'Hipercard',
-            'diners': 'Diners Club',
-            'discover': 'Discover',
-            'jcb': 'JCB',
-            'aura': 'Aura',
-            'maestro': 'Maestro'
-        }
+    # As tabelas de bandeiras abaixo são somente leitura: são lidas uma única
+    # vez, na criação da classe, para montar as tabelas de despacho
+    # (_BANDEIRAS, _PREFIXOS_POR_COMPRIMENTO), de modo que redefini-las em uma
+    # instância ou subclasse não altera a identificação.
+
+    # Padrões regex para identificação de bandeiras, ancorados com ^ e $.
+    # A ordem é a de verificação: das bandeiras mais frequentes para as mais
+    # raras. Aura deve vir antes de Maestro, cujo padrão também aceita os
+    # números Aura de 19 dígitos.
+    padroes_bandeiras = MappingProxyType({
+        'visa': r'^4[0-9]{12}(?:[0-9]{3})?$',
+        'mastercard': r'^5[1-5][0-9]{14}$|^2[2-7][0-9]{14}$',
+        'elo': r'^(?:16(?:5[2-9]|[67][0-9])|4(?:0117[89]|3(?:1274|8935)|5(?:1416|7393|763[12]))|50(?:[01][0-9]|2[1-9]|3[0-9]|4(?:[0-9]|175)|5[0-8]|6(?:699|7(?:[0-6][0-9]|7[0-8]))|9[0-9]{3})|6(?:27780|3(?:6297|636[89])|5(?:0(?:0(?:3[1-3]|[5-9])|4[0-9]|5[01])|4(?:0[5-9]|[1-3][0-9]|8[5-9]|9[0-9])|5(?:[0-2][0-9]|3[0-8]|4[1-9]|[5-8][0-9]|9[0-8])|7(?:0[0-9]|1[0-8]|2[0-7])|9(?:0[1-9]|[1-6][0-9]|7[0-8]))))$',
+        'amex': r'^3[47][0-9]{13}$',
+        'hipercard': r'^(606282\d{10}(\d{3})?|3841\d{15})$',
+        'discover': r'^6(?:011|5[0-9]{2})[0-9]{12}$',
+        'jcb': r'^(?:2131|1800|35\d{3})\d{11}$',
+        'diners': r'^3(?:0[0-5]|[68][0-9])[0-9]{11}$',
+        'aura': r'^5078\d{2}\d{2}\d{11}$',
+        'maestro': r'^(?:5[0678]\d\d|6304|6390|67\d\d)\d{8,15}$'
+    })
+
+    # Nomes das bandeiras em português
+    nomes_bandeiras = MappingProxyType({
+        'visa': 'Visa',
+        'mastercard': 'Mastercard',
+        'elo': 'Elo',
+        'amex': 'American Express',
+        'hipercard': 'Hipercard',
+        'discover': 'Discover',
+        'jcb': 'JCB',
+        'diners': 'Diners Club',
+        'aura': 'Aura',
+        'maestro': 'Maestro'
+    })
+
+    # Prefixos (IIN) com que cada bandeira pode começar; todo número aceito
+    # pelo padrão da bandeira deve começar por um deles (prefixos de 1, 2, 4
+    # ou 6 dígitos, os comprimentos consultados em identificar_bandeira)
+    prefixos_bandeiras = MappingProxyType({
+        'visa': ('4',),
+        'mastercard': ('51', '52', '53', '54', '55', '22', '23', '24', '25', '26', '27'),
+        'elo': ('4011', '43', '45', '50', '627780', '63', '65', '16'),
+        'amex': ('34', '37'),
+        'hipercard': ('606282', '3841'),
+        'discover': ('6011', '65'),
+        'jcb': ('2131', '1800', '35'),
+        'diners': ('30', '36', '38'),
+        'aura': ('5078',),
+        'maestro': ('50', '56', '57', '58', '6304', '6390', '67')
+    })
+
+    # Comprimentos (em dígitos) dos números aceitos pelo padrão de cada bandeira
+    comprimentos_bandeiras = MappingProxyType({
+        'visa': (13, 16),
+        'mastercard': (16,),
+        'elo': (4, 5, 6),
+        'amex': (15,),
+        'hipercard': (16, 19),
+        'discover': (16,),
+        'jcb': (15, 16),
+        'diners': (14,),
+        'aura': (19,),
+        'maestro': tuple(range(12, 20))
+    })
+
+    # Padrões pré-compilados, já associados ao nome de exibição da bandeira
+    _BANDEIRAS = _compilar_bandeiras(padroes_bandeiras, nomes_bandeiras)
+
+    # Bandeiras candidatas por comprimento e prefixo do número; os prefixos são
+    # consultados do mais longo para o mais curto
+    _PREFIXOS_POR_COMPRIMENTO = _indexar_por_comprimento(_BANDEIRAS, prefixos_bandeiras, comprimentos_bandeiras)
+
+    # Nomes das bandeiras na ordem dos identificadores das expressões do Hyperscan
+    _NOMES_HYPERSCAN = tuple(nome for _, nome in _BANDEIRAS.values())
+
+    def __init__(self, usar_hyperscan: bool = False, tamanho_cache: int = 0, usar_numba: bool = False):
+        """
+        Args:
+            usar_hyperscan: Identifica a bandeira com o Hyperscan em vez da
+                tabela de prefixos (requer o pacote ``hyperscan``). Desativado
+                por padrão: para números isolados a tabela de prefixos é mais
+                rápida.
+            tamanho_cache: Quantidade de números cujo resultado (Luhn e
+                bandeira) validar_cartao memoriza. Desativado por padrão (0),
+                pois o cache guarda números de cartão completos na memória do
+                processo; use limpar_cache() para descartá-los.
+            usar_numba: Compila com o Numba (requer ``numba`` e ``numpy``) o
+                laço do algoritmo Luhn para os comprimentos não cobertos pela
+                extensão C. A importação e a compilação (décimos de segundo)
+                ocorrem aqui, na criação do validador, e não na primeira
+                validação. Desativado por padrão.
+        """
+        # Cache opcional por instância, sobre os métodos desta instância (e
+        # portanto sobre eventuais sobrescritas em subclasses)
+        if tamanho_cache > 0:
+            self._validar_luhn_e_bandeira = functools.lru_cache(maxsize=tamanho_cache)(self._validar_luhn_e_bandeira)
+
+        # Base do Hyperscan (None quando não solicitada), montada da mesma
+        # tabela _BANDEIRAS que _NOMES_HYPERSCAN, e uma área de trabalho
+        # (scratch) por thread, que não pode ser compartilhada entre
+        # varreduras simultâneas
+        self._hyperscan = _compilar_hyperscan(self._BANDEIRAS) if usar_hyperscan else None
+        self._scratch_hyperscan = threading.local()
+
+        # Laço Luhn compilado pelo Numba (None quando não solicitado ou
+        # indisponível)
+        self._luhn_nativo = _compilar_luhn_njit() if usar_numba else None
+
+    def limpar_cache(self) -> None:
+        """
+        Descarta os números memorizados pelo cache de validar_cartao, se houver.
+        """
+        cache_clear = getattr(self._validar_luhn_e_bandeira, 'cache_clear', None)
+        if cache_clear is not None:
+            cache_clear()
 
     def limpar_numero(self, numero: str) -> str:
         """
@@ -70,9 +460,15 @@ class ValidadorCartaoCredito:
             numero: Número do cartão com ou sem formatação
 
         Returns:
-            str: Número limpo contendo apenas dígitos
+            str: Número limpo contendo apenas dígitos ASCII (0-9)
         """
-        return re.sub(r'[^0-9]', '', str(numero))
+        numero = str(numero).translate(_REMOVER_NAO_DIGITOS)
+
+        # Restou algum caractere fora do Latin-1: recorrer à expressão regular
+        if not numero.isascii():
+            numero = re.sub(r'[^0-9]', '', numero)
+
+        return numero
 
     def validar_luhn(self, numero: str) -> bool:
         """
@@ -87,37 +483,39 @@ class ValidadorCartaoCredito:
         Returns:
             bool: True se o número for válido pelo algoritmo Luhn, False caso contrário
         """
-        # Limpar o número
-        numero = self.limpar_numero(numero)
+        return self._validar_luhn_limpo(self.limpar_numero(numero))
 
-        # Verificar se o número contém apenas dígitos
-        if not numero.isdigit():
-            return False
-
-        # Converter para lista de inteiros
-        digitos = [int(d) for d in numero]
+    def _validar_luhn_limpo(self, numero: str) -> bool:
+        """
+        Aplica o algoritmo Luhn a um número já limpo por limpar_numero.
 
-        # Remover o último dígito (check digit)
-        check_digit = digitos.pop()
+        Args:
+            numero: Número do cartão contendo apenas dígitos
 
-        # Reverter os dígitos restantes
-        digitos.reverse()
+        Returns:
+            bool: True se o número for válido pelo algoritmo Luhn, False caso contrário
+        """
+        # Número vazio (nenhum dígito na entrada original)
+        if not numero:
+            return False
 
-        # Dobrar dígitos em índices pares (começando do 0)
-        for i in range(0, len(digitos), 2):
-            digitos[i] *= 2
-            # Se o resultado for maior que 9, subtrair 9
-            if digitos[i] > 9:
-                digitos[i] -= 9
+        # Caminho rápido em C para os comprimentos mais comuns
+        if _luhn is not None:
+            if len(numero) == 16:
+                return _luhn.luhn16(numero.encode('ascii'))
+            if len(numero) == 15:
+                return _luhn.luhn15(numero.encode('ascii'))
 
-        # Adicionar o check digit de volta
-        digitos.append(check_digit)
+        # Sem a extensão C, 16 dígitos usam a função desenrolada
+        if len(numero) == 16:
+            return _luhn16(numero)
 
-        # Calcular a soma total
-        soma_total = sum(digitos)
+        # Demais comprimentos (ou sem a extensão C): laço compilado pelo Numba,
+        # se solicitado na criação do validador
+        if self._luhn_nativo is not None:
+            return self._luhn_nativo(numero)
 
-        # Verificar se é divisível por 10
-        return soma_total % 10 == 0
+        return _luhn_aritmetico(numero)
 
     def identificar_bandeira(self, numero: str) -> Optional[str]:
         """
@@ -129,74 +527,197 @@ class ValidadorCartaoCredito:
         Returns:
             str: Nome da bandeira ou None se não identificada
         """
-        numero = self.limpar_numero(numero)
+        return self._identificar_limpo(self.limpar_numero(numero))
 
-        # Verificar cada padrão de bandeira
-        for bandeira, padrao in self.padroes_bandeiras.items():
-            if re.match(padrao, numero):
-                return self.nomes_bandeiras[bandeira]
+    def _identificar_limpo(self, numero: str) -> Optional[str]:
+        """
+        Identifica a bandeira de um número já limpo por limpar_numero.
+
+        Args:
+            numero: Número do cartão contendo apenas dígitos
+
+        Returns:
+            str: Nome da bandeira ou None se não identificada
+        """
+        if self._hyperscan is not None:
+            return self._identificar_hyperscan(numero)
+
+        # Selecionar as bandeiras candidatas pelo comprimento e prefixo do número
+        prefixos = self._PREFIXOS_POR_COMPRIMENTO.get(len(numero))
+        if prefixos is None:
+            return None
+
+        candidatos = (prefixos.get(numero[:6]) or prefixos.get(numero[:4])
+                      or prefixos.get(numero[:2]) or prefixos.get(numero[:1]) or ())
+
+        # Confirmar comprimento e faixa com o padrão completo de cada candidata
+        for padrao, nome in candidatos:
+            if padrao.fullmatch(numero):
+                return nome
 
         return None
 
-    def validar_cartao(self, numero: str) -> Dict[str, Any]:
+    def _identificar_hyperscan(self, numero: str) -> Optional[str]:
         """
-        Valida completamente um número de cartão de crédito.
+        Identifica a bandeira de um número já limpo usando a base do Hyperscan.
+
+        Todas as bandeiras que casam são coletadas em uma única varredura e
+        vence a de maior prioridade (menor identificador).
 
         Args:
-            numero: Número do cartão de crédito
+            numero: Número do cartão contendo apenas dígitos
 
         Returns:
-            dict: Dicionário com resultado da validação contendo:
-                - numero_original: Número como foi fornecido
-                - numero_limpo: Número apenas com dígitos
-                - valido_luhn: Se passou na validação Luhn
-                - bandeira: Nome da bandeira identificada
-                - valido_completo: Se é válido e tem bandeira identificada
-                - comprimento: Número de dígitos
-                - mensagem: Mensagem descritiva do resultado
+            str: Nome da bandeira ou None se não identificada
         """
-        numero_limpo = self.limpar_numero(numero)
+        scratch = getattr(self._scratch_hyperscan, 'scratch', None)
+        if scratch is None:
+            import hyperscan
+            scratch = self._scratch_hyperscan.scratch = hyperscan.Scratch(self._hyperscan)
+
+        encontradas = []
+        self._hyperscan.scan(
+            numero.encode('ascii'),
+            match_event_handler=lambda id_padrao, inicio, fim, flags, contexto: encontradas.append(id_padrao),
+            scratch=scratch
+        )
+        if not encontradas:
+            return None
+
+        return self._NOMES_HYPERSCAN[min(encontradas)]
+
+    def _validar_luhn_e_bandeira(self, numero_limpo: str) -> Tuple[bool, Optional[str]]:
+        """
+        Valida pelo algoritmo Luhn e identifica a bandeira de um número já limpo.
 
-        resultado = {
-            'numero_original': str(numero),
-            'numero_limpo': numero_limpo,
-            'valido_luhn': False,
-            'bandeira': None,
-            'valido_completo': False,
-            'comprimento': len(numero_limpo),
-            'mensagem': ''
-        }
+        Memorizado por instância quando o validador é criado com tamanho_cache.
+
+        Args:
+            numero_limpo: Número do cartão contendo apenas dígitos
 
-        # Verificar se o número contém apenas dígitos após limpeza
-        if not numero_limpo.isdigit():
-            resultado['mensagem'] = 'Número contém caracteres inválidos'
-            return resultado
+        Returns:
+            tuple: (válido pelo algoritmo Luhn, nome da bandeira ou None)
+        """
+        return self._validar_luhn_limpo(numero_limpo), self._identificar_limpo(numero_limpo)
 
-        # Verificar comprimento válido
-        if len(numero_limpo) < 13 or len(numero_limpo) > 19:
-            resultado['mensagem'] = 'Comprimento inválido (deve ter entre 13 e 19 dígitos)'
-            return resultado
+    def validar_cartao(self, numero: str) -> ResultadoValidacao:
+        """
+        Valida completamente um número de cartão de crédito.
 
-        # Validar com algoritmo Luhn
-        resultado['valido_luhn'] = self.validar_luhn(numero_limpo)
+        Args:
+            numero: Número do cartão de crédito
 
-        # Identificar bandeira
-        resultado['bandeira'] = self.identificar_bandeira(numero_limpo)
+        Returns:
+            ResultadoValidacao: Resultado da validação (use ``to_dict()`` para
+                obter o dicionário com as mesmas chaves)
+        """
+        numero_limpo = self.limpar_numero(numero)
+        comprimento = len(numero_limpo)
+
+        # Rejeitar antes da validação: vazio após a limpeza (não havia nenhum
+        # dígito) ou comprimento fora de 13 a 19 dígitos
+        if not 13 <= comprimento <= 19:
+            if numero_limpo:
+                mensagem = 'Comprimento inválido (deve ter entre 13 e 19 dígitos)'
+            else:
+                mensagem = 'Número contém caracteres inválidos'
+            return ResultadoValidacao(
+                numero_original=str(numero),
+                numero_limpo=numero_limpo,
+                valido_luhn=False,
+                bandeira=None,
+                valido_completo=False,
+                comprimento=comprimento,
+                mensagem=mensagem
+            )
+
+        # Validar com algoritmo Luhn e identificar bandeira
+        valido_luhn, bandeira = self._validar_luhn_e_bandeira(numero_limpo)
 
         # Determinar se é completamente válido
-        resultado['valido_completo'] = resultado['valido_luhn'] and resultado['bandeira'] is not None
+        valido_completo = valido_luhn and bandeira is not None
 
         # Definir mensagem de status
-        if resultado['valido_completo']:
-            resultado['mensagem'] = f'Cartão válido - Bandeira: {resultado["bandeira"]}'
-        elif resultado['valido_luhn'] and resultado['bandeira'] is None:
-            resultado['mensagem'] = 'Número válido pelo algoritmo Luhn, mas bandeira não identificada'
-        elif not resultado['valido_luhn'] and resultado['bandeira'] is not None:
-            resultado['mensagem'] = f'Bandeira identificada ({resultado["bandeira"]}), mas número inválido pelo algoritmo Luhn'
+        if valido_completo:
+            mensagem = f'Cartão válido - Bandeira: {bandeira}'
+        elif valido_luhn and bandeira is None:
+            mensagem = 'Número válido pelo algoritmo Luhn, mas bandeira não identificada'
+        elif not valido_luhn and bandeira is not None:
+            mensagem = f'Bandeira identificada ({bandeira}), mas número inválido pelo algoritmo Luhn'
         else:
-            resultado['mensagem'] = 'Número inválido'
+            mensagem = 'Número inválido'
+
+        return ResultadoValidacao(
+            numero_original=str(numero),
+            numero_limpo=numero_limpo,
+            valido_luhn=valido_luhn,
+            bandeira=bandeira,
+            valido_completo=valido_completo,
+            comprimento=comprimento,
+            mensagem=mensagem
+        )
+
+    def eh_valido(self, numero: str) -> bool:
+        """
+        Verifica se o número de cartão de crédito é completamente válido.
+
+        Equivale a ``validar_cartao(numero).valido_completo``, sem montar o
+        ResultadoValidacao nem a mensagem.
+
+        Args:
+            numero: Número do cartão de crédito
+
+        Returns:
+            bool: True se o número tiver comprimento válido, passar no algoritmo
+                Luhn e tiver bandeira identificada
+        """
+        # A limpeza só remove caracteres: entrada com menos de 13 caracteres
+        # não chega a 13 dígitos e é rejeitada sem ser limpa
+        numero = str(numero)
+        if len(numero) < 13:
+            return False
+
+        numero = self.limpar_numero(numero)
+        return (13 <= len(numero) <= 19 and self._validar_luhn_limpo(numero)
+                and self._identificar_limpo(numero) is not None)
+
+    def validar_cartoes(self, numeros: Iterable[str]) -> List[bool]:
+        """
+        Valida vários números de cartão de crédito de uma vez.
+
+        Os números são agrupados por comprimento e o algoritmo Luhn de cada
+        grupo é calculado com NumPy, quando disponível (importado na primeira
+        chamada). A bandeira só é identificada para os números que passam no
+        algoritmo Luhn.
+
+        Args:
+            numeros: Números de cartão de crédito
+
+        Returns:
+            list: Para cada número, se é completamente válido (equivalente a
+                ``validar_cartao(numero).valido_completo``)
+        """
+        limpos = [self.limpar_numero(numero) for numero in numeros]
+        validos = [False] * len(limpos)
+
+        # Agrupar os índices dos números de comprimento válido por comprimento
+        por_comprimento: Dict[int, List[int]] = {}
+        for i, numero in enumerate(limpos):
+            if 13 <= len(numero) <= 19:
+                por_comprimento.setdefault(len(numero), []).append(i)
+
+        for comprimento, indices in por_comprimento.items():
+            grupo = [limpos[i] for i in indices]
+            if _importar_numpy() is not None:
+                luhn = _luhn_lote(grupo, comprimento)
+            else:
+                luhn = [self._validar_luhn_limpo(numero) for numero in grupo]
+
+            for i, valido_luhn in zip(indices, luhn):
+                if valido_luhn:
+                    validos[i] = self._identificar_limpo(limpos[i]) is not None
 
-        return resultado
+        return validos
 
     def formatar_numero(self, numero: str, bandeira: Optional[str] = None) -> str:
         """
@@ -212,21 +733,21 @@ class ValidadorCartaoCredito:
         numero = self.limpar_numero(numero)
 
         if not bandeira:
-            bandeira = self.identificar_bandeira(numero)
+            bandeira = self._identificar_limpo(numero)
 
         # Formatação específica por bandeira
         if bandeira == 'American Express':
             # Amex: XXXX-XXXXXX-XXXXX
             if len(numero) == 15:
-                return f"{numero[:4]}-{numero[4:10]}-{numero[10:]}"
+                return '-'.join((numero[:4], numero[4:10], numero[10:]))
         elif bandeira == 'Diners Club':
             # Diners: XXXX-XXXXXX-XXXX
             if len(numero) == 14:
-                return f"{numero[:4]}-{numero[4:10]}-{numero[10:]}"
+                return '-'.join((numero[:4], numero[4:10], numero[10:]))
         else:
             # Outros cartões: XXXX-XXXX-XXXX-XXXX
             if len(numero) == 16:
-                return f"{numero[:4]}-{numero[4:8]}-{numero[8:12]}-{numero[12:]}"
+                return '-'.join((numero[:4], numero[4:8], numero[8:12], numero[12:]))
 
         # Formatação padrão se não couber em nenhuma categoria
         return numero
@@ -264,13 +785,13 @@ def main():
         resultado = validador.validar_cartao(numero)
 
         print(f"{i:2d}. Número: {numero}")
-        if resultado['valido_completo']:
-            numero_formatado = validador.formatar_numero(resultado['numero_limpo'], resultado['bandeira'])
+        if resultado.valido_completo:
+            numero_formatado = validador.formatar_numero(resultado.numero_limpo, resultado.bandeira)
             print(f"    Formatado: {numero_formatado}")
-        print(f"    Bandeira: {resultado['bandeira'] or 'Não identificada'}")
-        print(f"    Comprimento: {resultado['comprimento']} dígitos")
-        print(f"    Luhn: {'✓' if resultado['valido_luhn'] else '✗'}")
-        print(f"    Status: {resultado['mensagem']}")
+        print(f"    Bandeira: {resultado.bandeira or 'Não identificada'}")
+        print(f"    Comprimento: {resultado.comprimento} dígitos")
+        print(f"    Luhn: {'✓' if resultado.valido_luhn else '✗'}")
+        print(f"    Status: {resultado.mensagem}")
         print()
 
     # Demonstrar uso interativo
@@ -290,15 +811,15 @@ def main():
             resultado = validador.validar_cartao(entrada)
 
             print(f"\nResultado:")
-            print(f"  Número original: {resultado['numero_original']}")
-            print(f"  Número limpo: {resultado['numero_limpo']}")
-            if resultado['valido_completo']:
-                numero_formatado = validador.formatar_numero(resultado['numero_limpo'], resultado['bandeira'])
+            print(f"  Número original: {resultado.numero_original}")
+            print(f"  Número limpo: {resultado.numero_limpo}")
+            if resultado.valido_completo:
+                numero_formatado = validador.formatar_numero(resultado.numero_limpo, resultado.bandeira)
                 print(f"  Número formatado: {numero_formatado}")
-            print(f"  Bandeira: {resultado['bandeira'] or 'Não identificada'}")
-            print(f"  Válido (Luhn): {'Sim' if resultado['valido_luhn'] else 'Não'}")
-            print(f"  Completamente válido: {'Sim' if resultado['valido_completo'] else 'Não'}")
-            print(f"  Status: {resultado['mensagem']}")
+            print(f"  Bandeira: {resultado.bandeira or 'Não identificada'}")
+            print(f"  Válido (Luhn): {'Sim' if resultado.valido_luhn else 'Não'}")
+            print(f"  Completamente válido: {'Sim' if resultado.valido_completo else 'Não'}")
+            print(f"  Status: {resultado.mensagem}")
             print()
 
         except KeyboardInterrupt: